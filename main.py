@@ -2,17 +2,17 @@
 import pygame
 # Numpy handles the array manipulation
 import numpy as np
-# Gauss used to generate random vectors and uniform used to select parents
-from random import gauss, seed, uniform
-# Sleep used to set the frame rate and time used to do timing analysis for debugging
-from time import sleep, time
+# Numba compiles the per-frame update of the dots to machine code
+from numba import njit, prange
 
 
 # Configurables
 swarm_size = 50         # Number of dots in the swarm - as this increases, time taken to start new iteration increases
+brain_size = 400        # Number of direction vectors (genes) each dot has - also the most moves a dot can make
 mutation_rate = 0.01    # Sets the likelihood of a gene/vector getting randomly mutated when generating offspring
 dot_max_velocity = 15   # Velocity limit for each dot - if too high it can overshoot the goal or get embedded in barrier
 frame_rate = 100        # Frequency of screen redraw - also increases algorithm call rate (dots appear to move faster)
+debug = False           # Print the stats of each generation to the terminal
 
 # Initialise screen
 screen = 0
@@ -25,8 +25,17 @@ width = 1600
 rect_1 = (0, 200, width/2.5, 50)
 rect_2 = (width/2, 500, width, 50)
 
-# Define goal
-goal = np.array([20, width/2], dtype=np.int64)
+# Precompute the rectangle edges used in the collision checks (y0/y1 are the top/bottom, x0/x1 the left/right)
+rect_1_y0, rect_1_y1 = np.float32(rect_1[1]), np.float32(rect_1[1] + rect_1[3])
+rect_1_x0, rect_1_x1 = np.float32(rect_1[0]), np.float32(rect_1[0] + rect_1[2])
+rect_2_y0, rect_2_y1 = np.float32(rect_2[1]), np.float32(rect_2[1] + rect_2[3])
+rect_2_x0, rect_2_x1 = np.float32(rect_2[0]), np.float32(rect_2[0] + rect_2[2])
+
+# Define goal (kept as a single row so it broadcasts against the dot positions without a dtype change)
+goal = np.array([[20, width/2]], dtype=np.float32)
+
+# Define where all dots start from
+start = np.array([height - 125, width * 0.95], dtype=np.float32)
 
 # Define some colours
 black = (0, 0, 0)
@@ -42,326 +51,278 @@ yellow = (255, 255, 0)
 dead_count = 0
 goal_count = 0
 
+# Random number generator used for every random draw in the script, created once at import and never reseeded
+rng = np.random.default_rng()
 
-class Brain:
 
-    def __init__(self, size):
-        # This function runs when class gets initialised
+def random_unit_vectors(shape):
+    # Generate an array of random unit vectors in one go (the last dimension of shape holds the 2 components)
 
-        # Series of vectors which get the dot to the goal
-        self.directions = np.zeros((size, 2))
+    # Generate the random vectors
+    vec = rng.standard_normal(shape, dtype=np.float32)
 
-        # Record of how many steps have been taken so far
-        self.step = 0
+    # Divide each vector by its magnitude (found using pythagoras) to get unit vectors
+    return vec / np.sqrt((vec**2).sum(-1, keepdims=True))
 
-        # Randomize the initialised array with random vectors
-        self.randomize()
 
-    def randomize(self):
-        # Generate a random unit vector for each vector in directions
-        for i in range(self.directions.__len__()):
-            # Generate a random vector
-            seed(time())
-            vec = np.array([gauss(0, 1), gauss(0, 1)])
+def randomize_directions(directions):
+    # Set every vector in directions to a random unit vector (works on a single brain or a whole block of brains)
+    directions[:] = random_unit_vectors(directions.shape)
 
-            # Get magnitude of vector using pythagoras
-            mag = (vec**2).sum()**0.5
 
-            # Divide vector by magnitude to get unit vector
-            self.directions[i] = vec/mag
+def mutate_directions(directions):
+    # Mutates brains by randomizing some of their vectors (works on a single brain or a whole block of brains)
 
-    def clone(self):
-        # Return a copy of the current brain object with identical direction vectors
-        # The direction vectors are analogous to genes
+    # A vector is mutated if a random number between 0 and 1 (all numbers equally likely) is lower than mutation rate
+    mutated = rng.random(directions.shape[:-1]) < mutation_rate
 
-        # Create an instance of this class
-        clone_brain = Brain(self.directions.__len__())
+    # Set the mutated directions to be random directions
+    directions[mutated] = random_unit_vectors((int(mutated.sum()), 2))
 
-        # Copy over the direction vectors to the cloned brain
-        np.copyto(clone_brain.directions, self.directions)
 
-        return clone_brain
+@njit(cache=True, fastmath=True, parallel=True)
+def step_kernel(pos, vel, acc, directions, step, dead, reached_goal, height, width, goal_y, goal_x,
+                rect_1_y0, rect_1_y1, rect_1_x0, rect_1_x1, rect_2_y0, rect_2_y1, rect_2_x0, rect_2_x1, max_velocity,
+                min_step):
+    # Move every active dot one step and check for collisions, in one pass over the dots (run in parallel)
+    # Returns the number of dots that died and the number of dots that reached the goal during this step
 
-    def mutate(self):
-        # Mutates the brain by randomizing some of the vectors
+    newly_dead = 0
+    newly_reached = 0
 
-        for i in range(self.directions.__len__()):
-            # Iterate through all the vectors in directions
+    # Squared velocity limit, worked out once rather than for every dot
+    max_velocity_sq = max_velocity * max_velocity
 
-            # Generate a random number between 0 and 1 (all numbers equally likely)
-            rand = uniform(0, 1)
+    for i in prange(pos.shape[0]):
+        # Only move if the dot is still within the window and hasn't reached the goal
+        if not dead[i] and not reached_goal[i]:
 
-            # If the number generated is lower than mutation rate, then the vector should be mutated
-            if rand < mutation_rate:
-                # Set this direction to be a random direction
+            if step[i] > min_step or step[i] >= directions.shape[1]:
+                # If the dot has exceeded the minimum number of steps or reached the end of the directions array, the
+                # dot is dead
+                dead[i] = True
+                newly_dead += 1
 
-                # Generate a random vector
-                seed(time())
-                vec = np.array([gauss(0, 1), gauss(0, 1)])
+            else:
+                # Set the acceleration as the next vector in the directions array and increment the step counter
+                acc[i, 0] = directions[i, step[i], 0]
+                acc[i, 1] = directions[i, step[i], 1]
+                step[i] += 1
+
+                # Update velocity
+                vel[i, 0] += acc[i, 0]
+                vel[i, 1] += acc[i, 1]
+
+                # Limit the magnitude of velocity (squared magnitude compared so the square root is only taken when
+                # the velocity needs scaling, and a single division gives the scale applied to both components)
+                velocity_mag_sq = vel[i, 0] * vel[i, 0] + vel[i, 1] * vel[i, 1]
+                if velocity_mag_sq > max_velocity_sq:
+                    scale = max_velocity / np.sqrt(velocity_mag_sq)
+                    vel[i, 0] *= scale
+                    vel[i, 1] *= scale
+
+                # Update position
+                pos[i, 0] += vel[i, 0]
+                pos[i, 1] += vel[i, 1]
+                y = pos[i, 0]
+                x = pos[i, 1]
+
+                if y < 2 or x < 2 or y > (height - 2) or x > (width - 2):
+                    # Dot is dead if it reached within 2 pixels of the edge of the window
+                    dead[i] = True
+                    newly_dead += 1
+
+                elif (goal_y - y) * (goal_y - y) + (goal_x - x) * (goal_x - x) < 400:
+                    # If the dot reached the goal (within 20 pixels, compared squared)
+                    reached_goal[i] = True
+                    newly_reached += 1
+
+                elif rect_1_y0 < y < rect_1_y1 and rect_1_x0 < x < rect_1_x1:
+                    # If the dot hits the first rectangle
+                    dead[i] = True
+                    newly_dead += 1
+
+                elif rect_2_y0 < y < rect_2_y1 and rect_2_x0 < x < rect_2_x1:
+                    # If the dot hits the second rectangle
+                    dead[i] = True
+                    newly_dead += 1
+
+    return newly_dead, newly_reached
+
+
+def dot_sprite(colour):
+    # Draw a dot of the given colour once on its own transparent surface, ready to be blitted onto the screen
+    sprite = pygame.Surface((20, 20), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, colour, (10, 10), 10, 0)
+    return sprite
 
-                # Get magnitude of vector using pythagoras
-                mag = (vec ** 2).sum() ** 0.5
 
-                # Divide vector by magnitude to get unit vector
-                self.directions[i] = vec / mag
+class Population:
 
+    def __init__(self, size):
+        # Sum of all population fitnesses combined
+        self.fitness_sum = 0
 
-class Dot:
+        # Keep track of population generation
+        self.gen = 1
 
-    def __init__(self):
-        # Will hold all the directions (analogous to genes) for this dot
-        self.brain = Brain(400)
+        # Index of the best performing dot
+        self.best_dot = 0
 
-        # A vector holding the current position, initialised to where all dots should start from
-        self.pos = np.array([height - 125, width * 0.95])
+        # Min number of steps taken by a dot to reach the goal
+        self.min_step = 400
 
-        # A vector to hold the velocity of the dot
-        self.vel = np.array([0, 0], dtype=np.float64)
+        # Number of dots in the population
+        self.size = size
 
-        # A vector to hold the acceleration of the dot
-        self.acc = np.array([0, 0], dtype=np.float64)
+        # The state of every dot is held in arrays indexed by dot, one row per dot
+        # Positions, velocities and directions are single precision, which is plenty for the simulation and halves
+        # the memory they take up
 
-        # Is the dot still active, or dead?
-        self.dead = 0
+        # Current position of each dot, initialised to where all dots should start from
+        self.pos = np.empty((size, 2), dtype=np.float32)
+        self.pos[:] = start
 
-        # Fitness measures how well the dot performed (closer to the target or fewer steps yield higher fitness)
-        self.fitness = 0
+        # Velocity of each dot
+        self.vel = np.zeros((size, 2), dtype=np.float32)
 
-        # Has the dot reach the goal?
-        self.reached_goal = 0
+        # Acceleration of each dot
+        self.acc = np.zeros((size, 2), dtype=np.float32)
 
-        # Set to 1 if this dot is the best dot in the swarm
-        self.is_best = 0
+        # Is the dot dead?
+        self.dead = np.zeros(size, dtype=bool)
 
-    def show(self, display_screen):
-        # Draw this dot on the screen
+        # Has the dot reached the goal?
+        self.reached_goal = np.zeros(size, dtype=bool)
 
-        if self.is_best:
-            # If this dot is the best, draw it in green
-            pygame.draw.circle(display_screen, green, (self.pos.astype(int)[1], self.pos.astype(int)[0]), 10, 0)
+        # Fitness measures how well the dot performed (closer to the target or fewer steps yield higher fitness)
+        self.fitness = np.zeros(size, dtype=np.float64)
 
-        else:
-            # If this is not the best, then draw it in red
-            pygame.draw.circle(display_screen, red, (self.pos.astype(int)[1], self.pos.astype(int)[0]), 10, 0)
+        # Record of how many steps each dot has taken so far
+        self.step = np.zeros(size, dtype=np.int32)
 
-    def move(self):
-        global dead_count
+        # Series of vectors which get each dot to the goal (analogous to genes)
+        self.directions = np.zeros((size, brain_size, 2), dtype=np.float32)
 
-        if self.brain.directions.__len__() > self.brain.step:
-            # If there are directions left set the acceleration as the next vector in the directions array
-            self.acc = self.brain.directions[self.brain.step]
-            # Increment the step counter to retrieve the next direction vector in the next iteration
-            self.brain.step += 1
-        else:
-            # If the end of directions array has been reached, the dot is dead
-            self.dead = 1
-            dead_count += 1
-            print("Out of moves")
+        # Buffer the brains of the next generation are built in (swapped with directions every generation)
+        self.directions_next = np.empty_like(self.directions)
 
-        # Update velocity
-        self.vel += self.acc
+        # Set to True for the best dot in the swarm
+        self.is_best = np.zeros(size, dtype=bool)
 
-        # Limit the magnitude of velocity to 15 (tweakable - too high and dot can be embedded in barrier and not edge)
-        velocity_mag = (self.vel**2).sum()**0.5
-        if velocity_mag > dot_max_velocity:
-            self.vel = dot_max_velocity * self.vel / velocity_mag
+        # Pre-render the dots so they are blitted rather than drawn every frame
+        self.red_sprite = dot_sprite(red)
+        self.green_sprite = dot_sprite(green)
 
-        # Update position
-        self.pos += self.vel
+        # Randomize the brains of all the dots at once
+        randomize_directions(self.directions)
 
-    def update(self):
-        global dead_count
-        global goal_count
-        # Call the move function and check for collisions
+    def show(self, display_screen):
+        # Show all the dots on the screen
 
-        if (not self.dead) and (not self.reached_goal):
-            # Move if the dot is still within the window and hasn't reached the goal
-            self.move()
+        # Convert all the positions to whole pixels in one go, offset to the top left corner of the dot sprites
+        corners = (self.pos.astype(np.int32) - 10).tolist()
 
-            if self.pos[0] < 2 or self.pos[1] < 2 or self.pos[0] > (height - 2) or self.pos[1] > (width - 2):
-                # Dot is dead if it reached within 2 pixels of the edge of the window
-                self.dead = 1
-                dead_count += 1
-                # print("Out of bounds")
+        for i in range(1, self.size):
+            self.show_dot(display_screen, i, corners[i])
 
-            elif np.linalg.norm(goal - self.pos) < 20:
-                # If the dot reached the goal
-                self.reached_goal = 1
-                goal_count += 1
+        # Draw the best dot last so it is on top of the others
+        self.show_dot(display_screen, 0, corners[0])
 
-            elif rect_1[1] < self.pos[0] < (rect_1[1] + rect_1[3]) and rect_1[0] < self.pos[1] < (
-                        rect_1[0] + rect_1[2]):
+    def show_dot(self, display_screen, i, corner):
+        # Draw a single dot on the screen by blitting its pre-rendered sprite
 
-                # If the dot hits the first rectangle
-                self.dead = 1
-                dead_count += 1
+        if self.is_best[i]:
+            # If this dot is the best, draw it in green
+            display_screen.blit(self.green_sprite, (corner[1], corner[0]))
+
+        else:
+            # If this is not the best, then draw it in red
+            display_screen.blit(self.red_sprite, (corner[1], corner[0]))
 
-            elif rect_2[1] < self.pos[0] < (rect_2[1] + rect_2[3]) and rect_2[0] < self.pos[1] < (
-                        rect_2[0] + rect_2[2]):
+    def update(self):
+        global dead_count
+        global goal_count
+        # Move all the active dots one step and check for collisions
 
-                # If the dot hits the second rectangle
-                self.dead = 1
-                dead_count += 1
+        # Move the dots and check for collisions in a single compiled pass
+        newly_dead, newly_reached = step_kernel(self.pos, self.vel, self.acc, self.directions, self.step, self.dead,
+                                                self.reached_goal, height, width, goal[0, 0], goal[0, 1],
+                                                rect_1_y0, rect_1_y1, rect_1_x0, rect_1_x1,
+                                                rect_2_y0, rect_2_y1, rect_2_x0, rect_2_x1, dot_max_velocity,
+                                                self.min_step)
+        dead_count += newly_dead
+        goal_count += newly_reached
 
     def calculate_fitness(self):
         # Calculate fitness, with a higher value being assigned for better performing dots
         # Preference given to dots that reached goal, over dots that came close but died
-        if self.reached_goal:
-            # If the dot reached the goal then the fitness is based on the amount of steps it took to get there
-            self.fitness = 1.0/16.0 + 1000.0/(self.brain.step**2)
-        else:
-            # If the dot didn't reach the goal then the fitness is based on how close it is to the goal
-            distance_to_goal = np.linalg.norm(goal - self.pos)
-            self.fitness = 1/(distance_to_goal ** 2)
 
-    def get_baby(self):
-        # Clone the parent
-        baby = Dot()
-        # Babies have the same brain as their parent
-        baby.brain = self.brain.clone()
-        return baby
+        # Squared distance of each dot from the goal
+        distance_sq = ((goal - self.pos)**2).sum(1)
 
+        # If the dot reached the goal then the fitness is based on the amount of steps it took to get there
+        # If the dot didn't reach the goal then the fitness is based on how close it is to the goal
+        # (steps are floored at 1 as np.where evaluates both branches for every dot)
+        self.fitness = np.where(self.reached_goal,
+                                1.0/16.0 + 1000.0/(np.maximum(self.step, 1).astype(np.float64)**2),
+                                np.reciprocal(distance_sq))
 
-class Population:
-
-    def __init__(self, size):
-        # Sum of all population fitnesses combined
-        self.fitness_sum = 0
-
-        # Keep track of population generation
-        self.gen = 1
-
-        # Index of the best performing dot
-        self.best_dot = 0
-
-        # Min number of steps taken by a dot to reach the goal
-        self.min_step = 400
-
-        # Array to hold all the dots in the population
-        self.dots = np.zeros(size, dtype=object)
-
-        # Assign the dot object to each element
-        for i in range(size):
-            self.dots[i] = Dot()
-
-    def show(self, display_screen):
-        # Show all the dots on the screen
-        for i in range(1, self.dots.__len__()):
-            self.dots[i].show(display_screen)
-
-        # To Check: Why is the best dot shown separately
-        self.dots[0].show(display_screen)
-
-    def update(self):
-        global dead_count
-        # Update all dots with their new positions
-
-        for i in range(self.dots.__len__()):
-            if self.dots[i].brain.step > self.min_step:
-                # If the dots have exceeded the minimum number of steps, then they should be killed
-                self.dots[i].dead = 1
-                dead_count += 1
-            else:
-                # Update the dots with their new positions
-                self.dots[i].update()
-
-    def calculate_fitness(self):
-        # Calculate the fitness values for each of the dots
-        for i in range(self.dots.__len__()):
-            self.dots[i].calculate_fitness()
+        # Sum of all the fitness values
+        self.fitness_sum = self.fitness.sum()
 
     def all_dots_dead(self):
         # Check if all the dots are dead or have reached the goal already (i.e. no dots active)
-        for i in range(self.dots.__len__()):
-            if (not self.dots[i].dead) and (not self.dots[i].reached_goal):
-                return 0
-
-        return 1
+        return not np.any(~(self.dead | self.reached_goal))
 
     def natural_selection(self):
         # Gets the next generation of dots
 
-        # New array of dots for babies
-        new_dots = np.zeros(self.dots.__len__(), dtype=object)
-
         # Find and set the best dot in current population
         self.set_best_dot()
 
         # Let the best dot live without getting mutated
-        new_dots[0] = self.dots[self.best_dot].get_baby()
-        new_dots[0].is_best = 1
-
-        # Calculate the sum of all the fitness values
-        self.calculate_fitness_sum()
+        self.directions_next[0] = self.directions[self.best_dot]
 
-        baby_time = 0   # temp variable to measure processing times
-        for i in range(1, new_dots.__len__()):
-            # Set each element in the array to a Dot() object
-            new_dots[i] = Dot()
+        # Select the parents of all the babies at once (considering fitness)
 
-            # Select parent based on fitness
-            parent = self.select_parent()
+        # This works by randomly choosing values between 0 and the sum of all the fitnesses and looking them up in
+        # the running sum of the fitnesses, picking the first dot at which the running sum exceeds the value. Dots
+        # with a higher fitness add more to the running sum so they have a higher chance of being chosen
+        running_sum = np.cumsum(self.fitness)
+        parents = np.searchsorted(running_sum, rng.random(self.size - 1) * running_sum[-1], side='right')
 
-            # Get baby from them
-            wait_time = time()  # temp variable to measure processing times
-            new_dots[i] = parent.get_baby()
-            baby_time += time() - wait_time  # temp variable to measure processing times
+        # Babies have the same brain as their parent (copied straight into the buffer, without a temporary array)
+        np.take(self.directions, parents, axis=0, out=self.directions_next[1:])
 
-        print("Baby: ", baby_time)  # temp: print processing time to get babies
+        # Set the current brains to be the new baby brains, keeping the old ones to be overwritten next generation
+        self.directions, self.directions_next = self.directions_next, self.directions
 
-        # Set the current dots to be the new baby dots
-        self.dots = new_dots
+        # Reset the babies back to the start
+        self.pos[:] = start
+        self.vel[:] = 0
+        self.acc[:] = 0
+        self.dead[:] = False
+        self.reached_goal[:] = False
+        self.fitness[:] = 0
+        self.step[:] = 0
+        self.is_best[:] = False
+        self.is_best[0] = True
 
         # Increment generation counter
         self.gen += 1
 
-    def calculate_fitness_sum(self):
-        self.fitness_sum = 0
-        for i in range(self.dots.__len__()):
-            self.fitness_sum += self.dots[i].fitness
-
-    def select_parent(self):
-        # Chooses dot from the population to return randomly(considering fitness)
-
-        # this function works by randomly choosing a value between 0 and the sum of all the fitnesses then go
-        # through all the dots and add their fitness to a running sum and if that sum is greater than the random
-        # value generated that dot is chosen since dots with a higher fitness function add more to the running
-        # sum then they have a higher chance of being chosen
-
-        # Get a random number that is within the range of fitness_sum
-        rand = uniform(0, self.fitness_sum)
-
-        running_sum = 0
-
-        # Go through the fitnesses, and when the running sum exceeds rand, return the dot at which this occurred
-        for i in range(self.dots.__len__()):
-            running_sum += self.dots[i].fitness
-            if running_sum > rand:
-                return self.dots[i]
-
-        # Should never get to this point
-        return 0
-
     def mutate_babies(self):
-        # Mutates the brains of all the babies
-        for i in range(1, self.dots.__len__()):
-            self.dots[i].brain.mutate()
+        # Mutates the brains of all the babies (the best dot in slot 0 is left untouched)
+        mutate_directions(self.directions[1:])
 
     def set_best_dot(self):
         # Finds the dot with the highest fitness, and sets it as the best dot
-
-        max_fitness = 0
-        max_index = 0
-        for i in range(self.dots.__len__()):
-            if self.dots[i].fitness > max_fitness:
-                max_fitness = self.dots[i].fitness
-                max_index = i
-
-        self.best_dot = max_index
+        self.best_dot = int(np.argmax(self.fitness))
 
         # If the best dot reached the goal, then reset min number of steps needed to reach goal
-        if self.dots[self.best_dot].reached_goal:
-            self.min_step = self.dots[self.best_dot].brain.step
+        if self.reached_goal[self.best_dot]:
+            self.min_step = int(self.step[self.best_dot])
 
 
 def draw_static_objects():
@@ -370,7 +331,7 @@ def draw_static_objects():
     pygame.draw.rect(screen, white, rect_2, 0)
 
     # Draw goal dot in blue
-    pygame.draw.circle(screen, blue, (goal[1], goal[0]), 10, 0)
+    pygame.draw.circle(screen, blue, (int(goal[0, 1]), int(goal[0, 0])), 10, 0)
 
 
 def main():
@@ -406,14 +367,28 @@ def main():
     # define a variable to control the main loop
     running = True
 
+    # Draw every move of the dots - toggled with the F key, when off each generation is fast-forwarded and only its
+    # final positions are drawn
+    render_every_frame = True
+
     # Track the number of moves
     moves = 0
 
+    # Clock used to cap the frame rate
+    clock = pygame.time.Clock()
+
     # main loop
     while running:
         # Increment number of iterations of this loop
         moves += 1
 
+        if not render_every_frame:
+            # Fast-forward through the rest of the generation without drawing or waiting between moves, so the
+            # labels and dots drawn below show where the generation ended up
+            while not swarm.all_dots_dead():
+                swarm.update()
+                moves += 1
+
         # Reset window with a black colour
         screen.fill(black)
 
@@ -425,20 +400,23 @@ def main():
         screen.blit(gen_label, (width/2 - 60, height - 20))
 
         # Draw label to show credits
-        stats_label = stats_font.render("Reached Goal: " + str(goal_count) + ", Dead: " + str(dead_count), False, white)
+        stats_label = stats_font.render("Reached Goal: " + str(goal_count) + ", Dead: " + str(dead_count) +
+                                        ", FPS: " + str(int(clock.get_fps())), False, white)
         screen.blit(stats_label, (width/2, height - 20))
 
         if swarm.all_dots_dead():
             # If all the dots are dead perform genetic algorithm
 
             # Update the screen to show the last position of dots
+            swarm.show(screen)
             pygame.display.update()
 
-            # Print stats on dots that reached the goal or got killed
-            print("Reached Goal: ", goal_count, "   Dead: ", dead_count)
+            if debug:
+                # Print stats on dots that reached the goal or got killed
+                print("Reached Goal: ", goal_count, "   Dead: ", dead_count)
 
-            # Print the number of moves taken by this generation
-            print("Moves: ", moves)
+                # Print the number of moves taken by this generation
+                print("Moves: ", moves)
 
             # Reset trackers
             moves = 0
@@ -460,8 +438,8 @@ def main():
         # Redraw the screen
         pygame.display.update()
 
-        # Sleep for 10 ms (yielding ~ 100 FPS)
-        sleep(1/frame_rate)
+        # Wait for whatever is left of this frame's time (yielding ~ 100 FPS)
+        clock.tick(frame_rate)
 
         # event handling, gets all event from the event queue
         for event in pygame.event.get():
@@ -469,6 +447,9 @@ def main():
             if event.type == pygame.QUIT:
                 # change the value to False, to exit the main loop
                 running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                # Switch between drawing every move and fast-forwarding whole generations
+                render_every_frame = not render_every_frame
 
 
 # run the main function only if this module is executed as the main script